@@ -172,8 +172,7 @@ def _remove_wiki_note(note_id: str, note: dict[str, Any]) -> None:
     if not wiki_path:
         return
 
-    if wiki_path.exists():
-        wiki_path.unlink()
+    wiki_path.unlink(missing_ok=True)
 
 
 def _filter_notes(